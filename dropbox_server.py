@@ -7,17 +7,32 @@ HTTP transport version for Smithery deployment.
 
 import os
 import io
+import re
+import bisect
+import asyncio
 import logging
-from typing import Optional, List, Dict, Any
+import tempfile
+from typing import Optional, List, Dict, Any, Callable
+from collections import OrderedDict
 from datetime import datetime
+import threading
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+from functools import cache, lru_cache
 import dropbox
+import requests
+from requests.adapters import HTTPAdapter
 from dropbox.exceptions import AuthError, ApiError
 from mcp.server.fastmcp import FastMCP
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 import uvicorn
 from starlette.middleware.cors import CORSMiddleware
 
 # File processing libraries
+try:
+    import pypdfium2 as pdfium
+except ImportError:
+    pdfium = None
+
 try:
     import PyPDF2
 except ImportError:
@@ -28,19 +43,34 @@ try:
 except ImportError:
     Document = None
 
+try:
+    import numpy as np
+    from numba import njit, types
+except ImportError:
+    np = None
+    njit = None
+
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
 # Set up logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-# Initialize MCP server
-mcp = FastMCP("Dropbox File Reader")
-
-# Global Dropbox client
-dropbox_client: Optional[dropbox.Dropbox] = None
+# Worker count for uvicorn; multi-worker is opt-in via WORKERS
+WORKERS = int(os.environ.get("WORKERS", "1"))
 
+# Initialize MCP server. With several uvicorn workers, MCP sessions must be
+# stateless - per-process session state would send follow-up requests
+# carrying an mcp-session-id to a worker that has never seen it.
+mcp = FastMCP("Dropbox File Reader", stateless_http=WORKERS > 1)
 
 class FileInfo(BaseModel):
     """File information structure."""
+    model_config = ConfigDict(frozen=True)
+
     name: str
     path: str
     size: int
@@ -51,6 +81,8 @@ class FileInfo(BaseModel):
 
 class SearchResult(BaseModel):
     """Search result structure."""
+    model_config = ConfigDict(frozen=True)
+
     file_path: str
     file_name: str
     match_context: str
@@ -58,22 +90,29 @@ class SearchResult(BaseModel):
     modified: str
 
 
-def initialize_dropbox_client():
-    """Initialize Dropbox client with access token from environment."""
-    global dropbox_client
-    
+@cache
+def _client() -> dropbox.Dropbox:
+    """Return the process-wide Dropbox client, initializing it on first use.
+
+    functools.cache makes every call after the first a plain dict lookup;
+    failed initialization is not cached, so a later call can retry.
+    """
     access_token = os.getenv('DROPBOX_ACCESS_TOKEN')
     if not access_token:
         raise ValueError(
             "DROPBOX_ACCESS_TOKEN environment variable is required. "
             "Get your token from https://www.dropbox.com/developers/apps"
         )
-    
+
     try:
-        dropbox_client = dropbox.Dropbox(access_token)
+        # Larger connection pool so the parallel download/search paths reuse
+        # warm TLS connections instead of re-handshaking per request
+        session = dropbox.create_session(max_connections=32)
+        client = dropbox.Dropbox(access_token, session=session, timeout=30)
         # Test the connection
-        dropbox_client.users_get_current_account()
+        client.users_get_current_account()
         logger.info("Dropbox client initialized successfully")
+        return client
     except AuthError as e:
         raise ValueError(f"Invalid Dropbox access token: {e}")
     except Exception as e:
@@ -82,103 +121,314 @@ def initialize_dropbox_client():
 
 def extract_text_from_pdf(file_content: bytes) -> str:
     """Extract text from PDF content."""
+    # Prefer pypdfium2 (C++ PDFium bindings) - much faster than pure-Python PyPDF2
+    if pdfium:
+        try:
+            pdf = pdfium.PdfDocument(file_content)
+            try:
+                parts = [page.get_textpage().get_text_range() for page in pdf]
+            finally:
+                pdf.close()
+            return "\n".join(parts).strip()
+        except Exception as e:
+            logger.warning(f"pypdfium2 extraction failed, falling back to PyPDF2: {e}")
+
     if not PyPDF2:
-        return "[PDF text extraction not available - install PyPDF2]"
-    
+        return "[PDF text extraction not available - install pypdfium2 or PyPDF2]"
+
     try:
         pdf_file = io.BytesIO(file_content)
         pdf_reader = PyPDF2.PdfReader(pdf_file)
-        text = ""
-        for page in pdf_reader.pages:
-            text += page.extract_text() + "\n"
-        return text.strip()
+        parts = [page.extract_text() or "" for page in pdf_reader.pages]
+        return "\n".join(parts).strip()
     except Exception as e:
         return f"[Error extracting PDF text: {e}]"
 
 
+def _spooled_buffer(file_content: bytes) -> tempfile.SpooledTemporaryFile:
+    """Seekable buffer that spills to disk above 8 MB to cap peak memory."""
+    buf = tempfile.SpooledTemporaryFile(max_size=8 << 20)
+    buf.write(file_content)
+    buf.seek(0)
+    return buf
+
+
 def extract_text_from_docx(file_content: bytes) -> str:
     """Extract text from DOCX content."""
     if not Document:
         return "[DOCX text extraction not available - install python-docx]"
-    
+
     try:
-        docx_file = io.BytesIO(file_content)
+        with _spooled_buffer(file_content) as docx_file:
+            doc = Document(docx_file)
+            parts = [paragraph.text for paragraph in doc.paragraphs]
+        return "\n".join(parts).strip()
+    except Exception as e:
+        return f"[Error extracting DOCX text: {e}]"
+
+
+def extract_text_from_pdf_iter(file_content: bytes):
+    """Yield PDF text page by page so callers can stop extracting early."""
+    if pdfium:
+        pdf = pdfium.PdfDocument(file_content)
+        try:
+            for page in pdf:
+                yield page.get_textpage().get_text_range()
+        finally:
+            pdf.close()
+        return
+
+    if not PyPDF2:
+        yield "[PDF text extraction not available - install pypdfium2 or PyPDF2]"
+        return
+
+    pdf_reader = PyPDF2.PdfReader(io.BytesIO(file_content))
+    for page in pdf_reader.pages:
+        yield page.extract_text() or ""
+
+
+def extract_text_from_docx_iter(file_content: bytes):
+    """Yield DOCX text paragraph by paragraph so callers can stop early."""
+    if not Document:
+        yield "[DOCX text extraction not available - install python-docx]"
+        return
+
+    with _spooled_buffer(file_content) as docx_file:
         doc = Document(docx_file)
-        text = ""
         for paragraph in doc.paragraphs:
-            text += paragraph.text + "\n"
-        return text.strip()
+            yield paragraph.text
+
+
+# Pooled session for temporary-link GETs (previews, range downloads), so
+# they reuse warm connections like the SDK session instead of paying a
+# fresh TCP+TLS handshake per request
+_http_session = requests.Session()
+_http_session.mount("https://", HTTPAdapter(pool_connections=32, pool_maxsize=32))
+
+
+# Files at or above this size are downloaded with parallel Range requests
+CONCURRENT_DOWNLOAD_THRESHOLD = 8 * 1024 * 1024
+
+
+def _download_concurrent(url: str, total_size: int, chunk_size: int = 8 * 1024 * 1024,
+                         max_workers: int = 8) -> bytes:
+    """Download a file URL with parallel HTTP Range requests into one buffer."""
+    buf = bytearray(total_size)
+
+    def _fetch_range(start: int, end: int):
+        response = _http_session.get(url, headers={"Range": f"bytes={start}-{end}"}, timeout=60)
+        response.raise_for_status()
+        # A 200 with the full body (or a short read) would silently corrupt
+        # the buffer; raise so the caller falls back to files_download
+        if response.status_code != 206 or len(response.content) != end - start + 1:
+            raise ValueError(
+                f"Range {start}-{end} returned status {response.status_code} "
+                f"with {len(response.content)} bytes"
+            )
+        buf[start:start + len(response.content)] = response.content
+
+    ranges = [(start, min(start + chunk_size, total_size) - 1)
+              for start in range(0, total_size, chunk_size)]
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(ranges))) as executor:
+        for future in [executor.submit(_fetch_range, start, end) for start, end in ranges]:
+            future.result()
+
+    return bytes(buf)
+
+
+def _download_file(file_path: str) -> bytes:
+    """Download file bytes, splitting large files into concurrent range requests."""
+    client = _client()
+    try:
+        link_result = client.files_get_temporary_link(file_path)
+        if link_result.metadata.size >= CONCURRENT_DOWNLOAD_THRESHOLD:
+            return _download_concurrent(link_result.link, link_result.metadata.size)
     except Exception as e:
-        return f"[Error extracting DOCX text: {e}]"
+        logger.debug(f"Concurrent download unavailable for {file_path}: {e}")
+
+    _, response = client.files_download(file_path)
+    return response.content
+
+
+# Extension dispatch: extraction handlers for binary document types plus
+# the set of extensions decoded directly as text. Shared by the content,
+# search, and preview paths so the lists can't drift apart.
+EXT_HANDLERS: Dict[str, Callable[[bytes], str]] = {
+    'pdf': extract_text_from_pdf,
+    'docx': extract_text_from_docx,
+    'doc': extract_text_from_docx,
+}
+TEXT_EXTS = frozenset({'txt', 'md', 'py', 'js', 'html', 'css', 'json', 'csv'})
+
+
+# Shared pool for CPU-bound document parsing. PyPDF2/python-docx hold the
+# GIL, so the thread pools above only overlap I/O; extracting in worker
+# processes lets batch searches parse on all cores.
+_process_pool: Optional[ProcessPoolExecutor] = None
+_process_pool_lock = threading.Lock()
+
+
+def _get_process_pool() -> ProcessPoolExecutor:
+    """Return the shared extraction process pool, creating it on first use."""
+    global _process_pool
+    with _process_pool_lock:
+        if _process_pool is None:
+            # Each uvicorn worker gets its share of the cores so WORKERS
+            # processes don't fan out to WORKERS * cpu_count extractors
+            max_procs = max(1, (os.cpu_count() or 2) // max(1, WORKERS))
+            _process_pool = ProcessPoolExecutor(max_workers=max_procs)
+    return _process_pool
+
+
+def _extract_in_pool(extractor, file_content: bytes) -> str:
+    """Run a CPU-bound extractor in the process pool, inline on failure."""
+    try:
+        return _get_process_pool().submit(extractor, file_content).result()
+    except Exception as e:
+        logger.debug(f"Process-pool extraction failed, running inline: {e}")
+        return extractor(file_content)
+
+
+# Extracted-content cache keyed (path, rev). An explicit OrderedDict LRU
+# instead of lru_cache so the capped read path can peek for an existing
+# entry without triggering a download on a miss.
+_CONTENT_CACHE_SIZE = 128
+_content_cache: Dict[tuple, str] = OrderedDict()
+_content_cache_lock = threading.Lock()
+
+
+def _cached_content_peek(file_path: str, rev: str) -> Optional[str]:
+    """Return the cached extraction for (path, rev) if present, else None."""
+    with _content_cache_lock:
+        text = _content_cache.get((file_path, rev))
+        if text is not None:
+            _content_cache.move_to_end((file_path, rev))
+        return text
+
+
+def _cached_content(file_path: str, rev: str) -> str:
+    """Download and extract a file, cached per (path, rev).
+
+    Keyed on the Dropbox revision so edits invalidate automatically.
+    """
+    cached = _cached_content_peek(file_path, rev)
+    if cached is not None:
+        return cached
+
+    text = _extract_content(file_path, _download_file(file_path))
+
+    with _content_cache_lock:
+        _content_cache[(file_path, rev)] = text
+        while len(_content_cache) > _CONTENT_CACHE_SIZE:
+            _content_cache.popitem(last=False)
+    return text
+
+
+def _extract_content(file_path: str, file_content: bytes) -> str:
+    """Extract text from downloaded bytes based on the file extension."""
+    file_ext = file_path.lower().split('.')[-1]
+
+    handler = EXT_HANDLERS.get(file_ext)
+    if handler:
+        return _extract_in_pool(handler, file_content)
+    elif file_ext in TEXT_EXTS:
+        # Text files: a NUL byte near the start means binary; otherwise a
+        # single decode pass with replacement handles any stray bytes
+        if b'\x00' in file_content[:4096]:
+            return "[Binary file - cannot display as text]"
+        return file_content.decode('utf-8', errors='replace')
+    else:
+        return f"[Unsupported file type: {file_ext}]"
+
+
+def get_file_head(file_path: str, nbytes: int) -> str:
+    """Download and decode only the first nbytes of a file via an HTTP Range request."""
+    link_result = _client().files_get_temporary_link(file_path)
+    response = _http_session.get(link_result.link,
+                                 headers={"Range": f"bytes=0-{nbytes - 1}"}, timeout=60)
+    response.raise_for_status()
+    # errors="replace" tolerates a UTF-8 sequence cut at the range boundary
+    return response.content.decode('utf-8', errors='replace')
+
+
+def _extract_limited(file_path: str, file_ext: str, limit: int) -> str:
+    """Extract a document, stopping once roughly limit characters are collected.
+
+    Skips the pages/paragraphs a capped read_file would throw away anyway.
+    """
+    file_content = _download_file(file_path)
+    pieces = (extract_text_from_pdf_iter(file_content) if file_ext == 'pdf'
+              else extract_text_from_docx_iter(file_content))
+
+    parts = []
+    total = 0
+    for part in pieces:
+        parts.append(part)
+        total += len(part) + 1
+        if total >= limit:
+            break
+    return "\n".join(parts).strip()
+
+
+@lru_cache(maxsize=32)
+def _cached_limited_content(file_path: str, rev: str, file_ext: str, limit: int) -> str:
+    """Capped extraction cached per (path, rev, limit) for repeat reads."""
+    return _extract_limited(file_path, file_ext, limit)
 
 
 def get_file_content(file_path: str) -> str:
     """Download and extract text content from a Dropbox file."""
-    if not dropbox_client:
-        raise ValueError("Dropbox client not initialized")
-    
     try:
-        # Download file content
-        _, response = dropbox_client.files_download(file_path)
-        file_content = response.content
-        
-        # Extract text based on file extension
-        file_ext = file_path.lower().split('.')[-1]
-        
-        if file_ext == 'pdf':
-            return extract_text_from_pdf(file_content)
-        elif file_ext in ['docx', 'doc']:
-            return extract_text_from_docx(file_content)
-        elif file_ext in ['txt', 'md', 'py', 'js', 'html', 'css', 'json', 'csv']:
-            # Text files
-            try:
-                return file_content.decode('utf-8')
-            except UnicodeDecodeError:
-                try:
-                    return file_content.decode('latin-1')
-                except UnicodeDecodeError:
-                    return "[Binary file - cannot display as text]"
-        else:
-            return f"[Unsupported file type: {file_ext}]"
-            
+        # Look up the current revision so repeat reads hit the cache
+        metadata = _client().files_get_metadata(file_path)
+        rev = getattr(metadata, 'rev', '')
+        return _cached_content(file_path, rev)
+
     except ApiError as e:
         raise ValueError(f"Dropbox API error: {e}")
     except Exception as e:
         raise ValueError(f"Error reading file: {e}")
 
 
+@lru_cache(maxsize=32)
+def _parse_file_types(file_types: str) -> tuple:
+    """Map a file_types argument to the tuple of matching extensions."""
+    if file_types.lower() == "all":
+        return tuple(f'.{ext}' for ext in list(EXT_HANDLERS) + sorted(TEXT_EXTS))
+    elif file_types.lower() == "pdf":
+        return ('.pdf',)
+    elif file_types.lower() == "docx":
+        return ('.docx', '.doc')
+    elif file_types.lower() == "txt":
+        return ('.txt', '.md')
+    else:
+        # Comma-separated list
+        return tuple(f'.{ext.strip()}' for ext in file_types.split(','))
+
+
 @mcp.tool()
-def search_files(query: str, file_types: str = "all", max_results: int = 10) -> List[SearchResult]:
+async def search_files(query: str, file_types: str = "all", max_results: int = 10) -> List[SearchResult]:
     """
     Search for files in Dropbox by name or content.
-    
+
     Args:
         query: Search query (searches file names and content)
         file_types: File types to search ("all", "pdf", "docx", "txt", or comma-separated list)
         max_results: Maximum number of results to return
     """
-    if not dropbox_client:
-        initialize_dropbox_client()
-    
+    # Blocking SDK calls run on a worker thread to keep the event loop free
+    return await asyncio.to_thread(_search_files_sync, query, file_types, max_results)
+
+
+def _search_files_sync(query: str, file_types: str, max_results: int) -> List[SearchResult]:
+    client = _client()
+
     results = []
-    extensions = []
-    
-    # Parse file types
-    if file_types.lower() == "all":
-        extensions = ['.pdf', '.docx', '.doc', '.txt', '.md', '.py', '.js', '.html', '.css', '.json', '.csv']
-    elif file_types.lower() == "pdf":
-        extensions = ['.pdf']
-    elif file_types.lower() == "docx":
-        extensions = ['.docx', '.doc']
-    elif file_types.lower() == "txt":
-        extensions = ['.txt', '.md']
-    else:
-        # Comma-separated list
-        extensions = [f'.{ext.strip()}' for ext in file_types.split(',')]
-    
+    extensions = _parse_file_types(file_types)
+
     try:
         # Search by filename first
-        search_result = dropbox_client.files_search_v2(
+        search_result = client.files_search_v2(
             query=query,
             options=dropbox.files.SearchOptions(
                 max_results=max_results * 2  # Get more to filter by extension
@@ -194,9 +444,9 @@ def search_files(query: str, file_types: str = "all", max_results: int = 10) ->
                 file_path = metadata.path_lower
                 file_name = metadata.name
                 
-                # Check if file extension matches
-                if any(file_path.endswith(ext) for ext in extensions):
-                    results.append(SearchResult(
+                # Check if file extension matches (endswith accepts a tuple)
+                if file_path.endswith(extensions):
+                    results.append(SearchResult.model_construct(
                         file_path=file_path,
                         file_name=file_name,
                         match_context=f"Filename match: {file_name}",
@@ -211,57 +461,71 @@ def search_files(query: str, file_types: str = "all", max_results: int = 10) ->
 
 
 @mcp.tool()
-def list_files(folder_path: str = "", max_files: int = 20) -> List[FileInfo]:
+async def list_files(folder_path: str = "", max_files: int = 20) -> List[FileInfo]:
     """
     List files and folders in a Dropbox directory.
-    
+
     Args:
         folder_path: Path to the folder (empty string for root)
         max_files: Maximum number of items to return
     """
-    if not dropbox_client:
-        initialize_dropbox_client()
-    
+    return await asyncio.to_thread(_list_files_sync, folder_path, max_files)
+
+
+def _list_files_sync(folder_path: str, max_files: int) -> List[FileInfo]:
+    client = _client()
+
     try:
         # Ensure path starts with / if not empty
         if folder_path and not folder_path.startswith('/'):
             folder_path = '/' + folder_path
-        
+
         # List folder contents
-        result = dropbox_client.files_list_folder(
+        result = client.files_list_folder(
             folder_path,
             limit=max_files
         )
         
+        # Fetch previews concurrently, pulling only the first ~2 KB of each
+        # file instead of a full sequential download per entry
+        preview_paths = [entry.path_lower for entry in result.entries
+                         if isinstance(entry, dropbox.files.FileMetadata)
+                         and entry.name.lower().split('.')[-1] in TEXT_EXTS]
+        previews: Dict[str, str] = {}
+        if preview_paths:
+            def _get_preview_head(path: str) -> str:
+                try:
+                    content = get_file_head(path, 2048)
+                    return content[:200] + "..." if len(content) > 200 else content
+                except Exception:
+                    return "[Could not load preview]"
+
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                previews = dict(zip(preview_paths,
+                                    executor.map(_get_preview_head, preview_paths)))
+
+        # model_construct skips field validation - metadata comes straight
+        # from the Dropbox SDK, so it is already the right shape
         files = []
         for entry in result.entries:
             if isinstance(entry, dropbox.files.FileMetadata):
-                # Get preview for text files
-                preview = None
-                if entry.name.lower().endswith(('.txt', '.md', '.py', '.js')):
-                    try:
-                        content = get_file_content(entry.path_lower)
-                        preview = content[:200] + "..." if len(content) > 200 else content
-                    except:
-                        preview = "[Could not load preview]"
-                
-                files.append(FileInfo(
+                files.append(FileInfo.model_construct(
                     name=entry.name,
                     path=entry.path_lower,
                     size=entry.size,
                     modified=entry.server_modified.isoformat(),
                     is_folder=False,
-                    content_preview=preview
+                    content_preview=previews.get(entry.path_lower)
                 ))
             elif isinstance(entry, dropbox.files.FolderMetadata):
-                files.append(FileInfo(
+                files.append(FileInfo.model_construct(
                     name=entry.name,
                     path=entry.path_lower,
                     size=0,
                     modified="",
                     is_folder=True
                 ))
-        
+
         return files
         
     except Exception as e:
@@ -269,45 +533,76 @@ def list_files(folder_path: str = "", max_files: int = 20) -> List[FileInfo]:
 
 
 @mcp.tool()
-def read_file(file_path: str, max_length: int = 5000) -> str:
+async def read_file(file_path: str, max_length: int = 5000) -> str:
     """
     Read and return the full content of a file.
-    
+
     Args:
         file_path: Full path to the file in Dropbox
         max_length: Maximum characters to return (0 for no limit)
     """
-    if not dropbox_client:
-        initialize_dropbox_client()
-    
+    return await asyncio.to_thread(_read_file_sync, file_path, max_length)
+
+
+def _read_file_sync(file_path: str, max_length: int) -> str:
+    _client()
+
     try:
+        # For text files with a length cap, fetch only the needed prefix
+        # (4 bytes/char covers worst-case UTF-8) instead of the whole file
+        file_ext = file_path.lower().split('.')[-1]
+        if max_length > 0 and file_ext in TEXT_EXTS:
+            try:
+                content = get_file_head(file_path, max_length * 4)
+                if len(content) > max_length:
+                    return content[:max_length] + f"\n\n[Content truncated at {max_length} characters]"
+                return content
+            except Exception as e:
+                logger.debug(f"Range read failed for {file_path}, downloading fully: {e}")
+
+        # Capped PDF/DOCX reads stop parsing once enough text is extracted
+        if max_length > 0 and file_ext in EXT_HANDLERS:
+            try:
+                metadata = _client().files_get_metadata(file_path)
+                rev = getattr(metadata, 'rev', '')
+                # Reuse the full extraction if an earlier call already cached it
+                content = _cached_content_peek(file_path, rev)
+                if content is None:
+                    content = _cached_limited_content(file_path, rev, file_ext, max_length)
+                if len(content) > max_length:
+                    return content[:max_length] + f"\n\n[Content truncated at {max_length} characters]"
+                return content
+            except Exception as e:
+                logger.debug(f"Streaming extraction failed for {file_path}, extracting fully: {e}")
+
         content = get_file_content(file_path)
-        
+
         if max_length > 0 and len(content) > max_length:
             return content[:max_length] + f"\n\n[Content truncated - file has {len(content)} total characters]"
-        
+
         return content
-        
+
     except Exception as e:
         raise ValueError(f"Failed to read file {file_path}: {e}")
 
 
 @mcp.tool()
-def get_file_info(file_path: str) -> FileInfo:
+async def get_file_info(file_path: str) -> FileInfo:
     """
     Get detailed information about a specific file.
-    
+
     Args:
         file_path: Full path to the file in Dropbox
     """
-    if not dropbox_client:
-        initialize_dropbox_client()
-    
+    return await asyncio.to_thread(_get_file_info_sync, file_path)
+
+
+def _get_file_info_sync(file_path: str) -> FileInfo:
     try:
-        metadata = dropbox_client.files_get_metadata(file_path)
+        metadata = _client().files_get_metadata(file_path)
         
         if isinstance(metadata, dropbox.files.FileMetadata):
-            return FileInfo(
+            return FileInfo.model_construct(
                 name=metadata.name,
                 path=metadata.path_lower,
                 size=metadata.size,
@@ -315,7 +610,7 @@ def get_file_info(file_path: str) -> FileInfo:
                 is_folder=False
             )
         else:
-            return FileInfo(
+            return FileInfo.model_construct(
                 name=metadata.name,
                 path=metadata.path_lower,
                 size=0,
@@ -327,78 +622,167 @@ def get_file_info(file_path: str) -> FileInfo:
         raise ValueError(f"Failed to get file info for {file_path}: {e}")
 
 
+@lru_cache(maxsize=64)
+def _compile_query(query: str):
+    """Compile and cache the case-insensitive pattern for a query."""
+    return re.compile(re.escape(query), re.IGNORECASE)
+
+
+@lru_cache(maxsize=64)
+def _build_automaton(query_lower: str):
+    """Compile and cache an Aho-Corasick automaton for a lowered query."""
+    automaton = ahocorasick.Automaton()
+    automaton.add_word(query_lower, 0)
+    automaton.make_automaton()
+    return automaton
+
+
+if njit:
+    # Explicit signature compiles at declaration time and cache=True persists
+    # the binary, so a fresh worker doesn't pay JIT warmup on its first query.
+    # Arrays are declared readonly since np.frombuffer views are immutable.
+    _readonly_u8 = types.Array(types.uint8, 1, 'C', readonly=True)
+    _kernel_sig = types.Tuple((types.int64[:], types.int64[:]))(_readonly_u8, _readonly_u8)
+
+    @njit(_kernel_sig, cache=True)
+    def _find_all_kernel(hay, needle):
+        """Scan hay (uint8) for case-folded needle, returning positions and lines."""
+        n = hay.shape[0]
+        m = needle.shape[0]
+        positions = np.empty(n // m + 1, dtype=np.int64)
+        lines = np.empty(n // m + 1, dtype=np.int64)
+        count = 0
+        line = 1
+        i = 0
+        while i < n:
+            if i + m <= n:
+                matched = True
+                for j in range(m):
+                    h = hay[i + j]
+                    if 65 <= h <= 90:  # fold ASCII upper to lower
+                        h += 32
+                    if h != needle[j]:
+                        matched = False
+                        break
+                if matched:
+                    positions[count] = i
+                    lines[count] = line
+                    count += 1
+                    for j in range(m):
+                        if hay[i + j] == 10:
+                            line += 1
+                    i += m
+                    continue
+            if hay[i] == 10:
+                line += 1
+            i += 1
+        return positions[:count], lines[:count]
+
+    try:
+        _find_all_kernel(np.zeros(1, dtype=np.uint8), np.zeros(1, dtype=np.uint8))
+    except Exception as e:
+        logger.warning(f"Numba search kernel unavailable: {e}")
+        _find_all_kernel = None
+else:
+    _find_all_kernel = None
+
+
 @mcp.tool()
-def search_file_content(file_paths: List[str], query: str, context_chars: int = 100) -> List[Dict[str, Any]]:
+async def search_file_content(file_paths: List[str], query: str, context_chars: int = 100) -> List[Dict[str, Any]]:
     """
     Search for text within specific files.
-    
+
     Args:
         file_paths: List of file paths to search in
         query: Text to search for
         context_chars: Number of characters of context around matches
     """
-    if not dropbox_client:
-        initialize_dropbox_client()
-    
-    results = []
-    
-    for file_path in file_paths:
+    await asyncio.to_thread(_client)
+
+    # Query machinery is compiled once and cached, so repeat searches
+    # with the same query reuse it across calls
+    pattern = _compile_query(query)
+
+    def _search_one(file_path: str) -> Optional[Dict[str, Any]]:
         try:
             content = get_file_content(file_path)
-            
-            # Search for query in content (case-insensitive)
-            query_lower = query.lower()
-            content_lower = content.lower()
-            
+
+            if _find_all_kernel is not None and query and content.isascii() and query.isascii():
+                # JIT'd byte scan: finds matches and line numbers in one pass
+                hay = np.frombuffer(content.encode(), dtype=np.uint8)
+                needle = np.frombuffer(query.lower().encode(), dtype=np.uint8)
+                positions, lines = _find_all_kernel(hay, needle)
+                hits = [(int(pos), int(line)) for pos, line in zip(positions, lines)]
+            else:
+                # Index newline offsets once so each match resolves its line
+                # number in O(log n) instead of rescanning the prefix
+                newlines = [i for i, c in enumerate(content) if c == '\n']
+                if ahocorasick and query:
+                    # Cached automaton: one linear scan per document
+                    content_lower = content.lower()
+                    hits = []
+                    prev_end = -1
+                    for end, _ in _build_automaton(query.lower()).iter(content_lower):
+                        pos = end - len(query) + 1
+                        if pos > prev_end:  # non-overlapping, like finditer
+                            hits.append((pos, bisect.bisect_left(newlines, pos) + 1))
+                            prev_end = end
+                else:
+                    hits = [(match.start(), bisect.bisect_left(newlines, match.start()) + 1)
+                            for match in pattern.finditer(content)]
+
             matches = []
-            start = 0
-            while True:
-                pos = content_lower.find(query_lower, start)
-                if pos == -1:
-                    break
-                
+            for pos, line_number in hits:
                 # Extract context around the match
                 context_start = max(0, pos - context_chars)
                 context_end = min(len(content), pos + len(query) + context_chars)
                 context = content[context_start:context_end]
-                
+
                 matches.append({
                     "position": pos,
                     "context": context,
-                    "line_number": content[:pos].count('\n') + 1
+                    "line_number": line_number
                 })
-                
-                start = pos + 1
-            
+
             if matches:
-                results.append({
+                return {
                     "file_path": file_path,
                     "file_name": file_path.split('/')[-1],
                     "matches": matches,
                     "total_matches": len(matches)
-                })
-                
+                }
+            return None
+
         except Exception as e:
             logger.warning(f"Error searching in {file_path}: {e}")
-            continue
-    
-    return results
+            return None
 
+    if not file_paths:
+        return []
 
-def main():
-    """Main entry point for the HTTP MCP server."""
-    print("Dropbox MCP Server starting...")
-    
-    # Initialize Dropbox client
-    try:
-        initialize_dropbox_client()
-    except Exception as e:
-        logger.warning(f"Dropbox client initialization failed: {e}")
-        logger.warning("Make sure to set DROPBOX_ACCESS_TOKEN environment variable")
-    
-    # Setup Starlette app with CORS for cross-origin requests
+    # Each file is an independent download + scan, so overlap them on the
+    # event loop's worker threads without blocking other tool calls
+    found = await asyncio.gather(
+        *[asyncio.to_thread(_search_one, file_path) for file_path in file_paths]
+    )
+    return [result for result in found if result]
+
+
+@mcp.tool()
+def clear_cache() -> str:
+    """
+    Clear the cached file contents so the next reads re-fetch from Dropbox.
+    """
+    with _content_cache_lock:
+        _content_cache.clear()
+    _cached_limited_content.cache_clear()
+    return "File content cache cleared"
+
+
+def build_app():
+    """Build the Starlette app with CORS for cross-origin requests."""
     app = mcp.streamable_http_app()
-    
+
     # Add CORS middleware for browser-based clients
     app.add_middleware(
         CORSMiddleware,
@@ -409,12 +793,37 @@ def main():
         expose_headers=["mcp-session-id", "mcp-protocol-version"],
         max_age=86400,
     )
-    
+    return app
+
+
+# Module-level so multi-worker uvicorn can import "dropbox_server:app"
+app = build_app()
+
+
+def main():
+    """Main entry point for the HTTP MCP server."""
+    print("Dropbox MCP Server starting...")
+
+    # Initialize Dropbox client
+    try:
+        _client()
+    except Exception as e:
+        logger.warning(f"Dropbox client initialization failed: {e}")
+        logger.warning("Make sure to set DROPBOX_ACCESS_TOKEN environment variable")
+
+    # uvloop cuts per-request event-loop overhead when available
+    try:
+        import uvloop  # noqa: F401
+        loop = "uvloop"
+    except ImportError:
+        loop = "asyncio"
+
     # Get port from environment variable (Smithery sets this to 8081)
     port = int(os.environ.get("PORT", 8080))
-    print(f"Listening on port {port}")
-    
-    uvicorn.run(app, host="0.0.0.0", port=port, log_level="info")
+    print(f"Listening on port {port} with {WORKERS} worker(s)")
+
+    uvicorn.run("dropbox_server:app", host="0.0.0.0", port=port,
+                workers=WORKERS, loop=loop, log_level="info")
 
 
 if __name__ == "__main__":